@@ -17,37 +17,73 @@
 
 
 # # Introduction: 
-# In this task, I explored data from the National Health and Nutrition Examination Survey (NHANES), a large-scale survey conducted to assess the health and nutritional status of adults and children in the United States. The datasets I worked with included various modules such as demographics, body measurements, alcohol use, dietary intake, and blood test results. These files were provided in .xpt format, which I imported using the pyreadstat library. After importing the datasets, I merged them on the unique participant identifier SEQN to create a unified DataFrame for analysis.
+# In this task, I explored data from the National Health and Nutrition Examination Survey (NHANES), a large-scale survey conducted to assess the health and nutritional status of adults and children in the United States. The datasets I worked with included various modules such as demographics, body measurements, alcohol use, dietary intake, and blood test results. These files were provided in .xpt format, which I imported using the polars-readstat library. After importing the datasets, I merged them on the unique participant identifier SEQN to create a unified DataFrame for analysis.
 # To prepare the data, I cleaned the merged DataFrame by removing duplicate records, dropping columns with missing values, and eliminating unnecessary variables based on a careful review of the NHANES documentation. I also renamed and recoded multiple columns to make them more human-readable and suitable for analysis. This included converting coded values (such as gender, race, and participation status) into descriptive labels, which helped make the analysis more intuitive and easier to interpret.
-# Following data preparation, I performed exploratory analysis using value_counts() and crosstab functions to understand the distribution and relationships among key variables like age group, gender, language of interview, country of birth, and proxy/interpreter usage. These insights guided the development of five visualisations using the Bokeh library, which allowed me to create interactive, aesthetically appealing plots such as heatmaps, scatter plots, and more. Throughout the task, I also reflected on the considerations and limitations of working with survey data, particularly when analyzing sensitive variables such as race, accessibility needs, and participation patterns.
+# Following data preparation, I performed exploratory analysis using category counts and crosstab functions to understand the distribution and relationships among key variables like age group, gender, language of interview, country of birth, and proxy/interpreter usage. These insights guided the development of five visualisations using the Bokeh library, which allowed me to create interactive, aesthetically appealing plots such as heatmaps, scatter plots, and more. Throughout the task, I also reflected on the considerations and limitations of working with survey data, particularly when analyzing sensitive variables such as race, accessibility needs, and participation patterns.
 
+import numpy as np
 import pandas as pd
 
-# # Installing required package 
-# The following command installs the pyreadstat package, a Python interface to the ReadStat C library. This library allows for fast and efficient reading Stata data files directly into pandas DataFrames. 
+# # Importing required packages 
+# The following code imports the polars-readstat and pyarrow packages. polars-readstat is a Rust-backed interface to the ReadStat library. It scans SAS transport files lazily, so only the columns that are actually selected get parsed before the data is handed over to pandas. Handing the data over to pandas with to_pandas() also requires the pyarrow package, which neither Polars nor polars-readstat installs on its own. Both packages are only installed (quietly, in one pip call) when either import fails, so restarting the kernel does not run pip again once they are available.
 
-pip install pyreadstat
-
-import pyreadstat
+try:
+    import pyarrow
+    from polars_readstat import scan_readstat
+except ImportError:
+    import subprocess
+    import sys
+    subprocess.check_call([sys.executable, '-m', 'pip', 'install', '-q', 'polars-readstat', 'pyarrow'])
+    import pyarrow
+    from polars_readstat import scan_readstat
 
 # # Loading files (in .xpt format) into dataframe
-# The following code uses the pyreadstat library to load multiple NHANES .xpt (SAS transport) files into pandas DataFrames. Each of these files contains data from a different NHANES survey module, including demographics, body measurements, alcohol use, complete blood counts, and dietary intake. The function pyreadstat.read_xport() returns a tuple where the first element is the actual dataset in the form of a pandas DataFrame, and the second element contains metadata such as column labels and data types. By appending [0] to each function call, we extract only the DataFrame portion, which is what we need for further data analysis. 
+# The following code uses the polars-readstat library to scan multiple NHANES .xpt (SAS transport) files as Polars lazy frames. Each of these files contains data from a different NHANES survey module, including demographics, body measurements, alcohol use, complete blood counts, and dietary intake. The scans do not read anything yet; they only record which file to read, and selecting the columns listed in needed_cols means the remaining columns are never decoded once the query runs. Only the demographics file contributes variables to the analysis, so keep_cols lists the final set of columns kept from it; the other modules are read for SEQN alone, which is what the merge below needs. Selecting the columns here, before merging, means the merge never copies columns that would be dropped straight afterwards. 
+# Parsing .xpt files is the slowest part of the notebook, so scan_cached() converts each file to a zstd-compressed Parquet file next to the original the first time it is read. Every later run (for example after a kernel restart) scans the Parquet copy instead, which is a columnar binary format that Polars can read without any parsing overhead. The whole file is cached, so changing keep_cols does not require deleting the cache, and the cache is rebuilt whenever the .xpt file is newer than its Parquet copy (for example after downloading it again). The Parquet file is first written under a temporary name and only then moved into place, so an interrupted conversion never leaves a truncated cache behind.
+
+from pathlib import Path
+import polars as pl
+
+
+def scan_cached(xpt_path, columns):
+    xpt_path= Path(xpt_path)
+    parquet_path= xpt_path.with_suffix('.parquet')
+    if not parquet_path.exists() or xpt_path.stat().st_mtime > parquet_path.stat().st_mtime:
+        tmp_path= parquet_path.with_suffix('.parquet.tmp')
+        scan_readstat(str(xpt_path)).collect().write_parquet(tmp_path, compression= 'zstd')
+        tmp_path.replace(parquet_path)
+    return pl.scan_parquet(parquet_path).select(columns)
+
+
+keep_cols= ['SEQN', 'RIDSTATR', 'RIAGENDR', 'RIDAGEYR', 'RIDRETH3', 'DMDBORN4', 'SIALANG',
+            'SIAPROXY', 'SIAINTRP', 'WTINTPRP', 'WTMECPRP', 'SDMVPSU', 'SDMVSTRA']
 
-df1= pyreadstat.read_xport(r"C:\Users\YAKSH CHEEMA\Downloads\P_DEMO.xpt")[0]
-df2= pyreadstat.read_xport(r"C:\Users\YAKSH CHEEMA\Downloads\P_BMX.xpt")[0]
-df3= pyreadstat.read_xport(r"C:\Users\YAKSH CHEEMA\Downloads\P_ALQ.xpt")[0]
-df4= pyreadstat.read_xport(r"C:\Users\YAKSH CHEEMA\Downloads\P_CBC.xpt")[0]
-df5= pyreadstat.read_xport(r"C:\Users\YAKSH CHEEMA\Downloads\P_DR1TOT.xpt")[0]
+needed_cols= [
+    keep_cols,
+    ['SEQN'],
+    ['SEQN'],
+    ['SEQN'],
+    ['SEQN'],
+]
+
+lf1= scan_cached(r"C:\Users\YAKSH CHEEMA\Downloads\P_DEMO.xpt", needed_cols[0])
+lf2= scan_cached(r"C:\Users\YAKSH CHEEMA\Downloads\P_BMX.xpt", needed_cols[1])
+lf3= scan_cached(r"C:\Users\YAKSH CHEEMA\Downloads\P_ALQ.xpt", needed_cols[2])
+lf4= scan_cached(r"C:\Users\YAKSH CHEEMA\Downloads\P_CBC.xpt", needed_cols[3])
+lf5= scan_cached(r"C:\Users\YAKSH CHEEMA\Downloads\P_DR1TOT.xpt", needed_cols[4])
 
 
 # # Merging dataframes 
-# This code merges the five individual NHANES DataFrames into a single combined dataset called dfs. Each merge is performed on the SEQN column, which serves as the unique participant identifier across all NHANES modules. The how="left" parameter ensures that all participants present in the main demographics file (df1) are retained, even if corresponding records from the other modules are missing. This approach preserves the full sample while integrating additional information from body measurements, alcohol use, blood tests, and dietary intake into one unified DataFrame, ready for analysis.
+# This code merges the five individual NHANES lazy frames into a single combined dataset called dfs. Each join is performed on the SEQN column, which serves as the unique participant identifier across all NHANES modules. The how="left" parameter ensures that all participants present in the main demographics file (lf1) are retained, even if corresponding records from the other modules are missing. Duplicate records are removed with unique() as part of the same query, so that each participant record is unique. Nothing is read until collect() is called: Polars then optimises the column selections, the joins and the de-duplication as one plan, and only the resulting table is converted to a pandas DataFrame with to_pandas() (which relies on pyarrow) for the rest of the analysis.
 #
 
-dfs= df1.merge(df2, on= "SEQN", how= "left")\
-     .merge(df3, on= "SEQN", how= "left")\
-     .merge(df4, on= "SEQN", how= "left")\
-     .merge(df5, on= "SEQN", how= "left")
+dfs= lf1.join(lf2, on= "SEQN", how= "left")\
+        .join(lf3, on= "SEQN", how= "left")\
+        .join(lf4, on= "SEQN", how= "left")\
+        .join(lf5, on= "SEQN", how= "left")\
+        .unique(maintain_order= True)\
+        .collect()\
+        .to_pandas()
 
 
 dfs.shape
@@ -56,13 +92,10 @@ dfs.info()
 
 # # Filtering Data
 
-# This line removes any duplicate rows from the merged dataset dfs to ensure that each participant record is unique. 
-
-dfs.drop_duplicates(inplace=True)
-
-# This line removes all columns from the dfs DataFrame that contain any missing values. This step is useful for simplifying the dataset by retaining only complete variables, especially when preparing data for visualisation or modeling where missing values could cause errors or skew results.
+# This code removes all columns from the dfs DataFrame that contain any missing values. This step is useful for simplifying the dataset by retaining only complete variables, especially when preparing data for visualisation or modeling where missing values could cause errors or skew results. The missing-value check is done as one NumPy reduction over the whole table, which gives a mask of the columns to keep.
 
-dfs.dropna(axis= 1, how= 'any', inplace= True)
+complete_cols= ~np.asarray(dfs.isna()).any(axis= 0)
+dfs= dfs.iloc[:, complete_cols]
 
 dfs.shape
 
@@ -70,16 +103,12 @@ dfs.info()
 
 dfs
 
-# I deleted the columns SEQN and SDDSRVYR from the dfs DataFrame because, after reading the documentation on the NHANES website, I found that these columns were not useful for my analysis. SEQN is just a participant identifier used for merging the files, and SDDSRVYR indicates the survey cycle, which wasn't relevant for my current task since all the data comes from the same cycle. Removing them helped simplify the dataset and focus only on the variables that actually matter for my visualisations and insights.
+# I deleted the column SEQN from the dfs DataFrame because it is just a participant identifier used for merging the files and is not useful for my analysis. SDDSRVYR and RIDRETH1 are left out of keep_cols entirely, after reading the documentation on the NHANES website: SDDSRVYR indicates the survey cycle, which wasn't relevant for my current task since all the data comes from the same cycle, and RIDRETH1 only differs from RIDRETH3 in that it does not include the Asian population category. Since RIDRETH3 is more comprehensive, I kept it instead to avoid redundancy in the dataset.
 
-dfs.drop(columns= ['SEQN','SDDSRVYR'], inplace= True)
+dfs.drop(columns= 'SEQN', inplace= True)
 
 dfs.shape
 
-# I deleted the column RIDRETH1 from the dfs DataFrame because, after comparing it with RIDRETH3, I found that the only difference was that RIDRETH1 did not include the Asian population category, whereas RIDRETH3 provides a more complete representation of race/ethnicity, including Asians. Since RIDRETH3 is more comprehensive, I decided to keep it and remove RIDRETH1 to avoid redundancy in the dataset.
-
-dfs.drop(columns= 'RIDRETH1', inplace= True)
-
 # # Decoding 
 # **Changing column names:** 
 # I carefully checked the NHANES website and read through the documentation for each dataset to understand what the columns represent. Based on that, I renamed several columns in the dfs DataFrame to make them more readable and meaningful for my analysis. For example, I renamed RIDSTATR to ParticipationStatus, RIAGENDR to Gender, and RIDAGEYR to AgeGroup. I followed this approach for all key variables like race, country of birth, interview language, interpreter and proxy use, and weight variables.
@@ -99,56 +128,56 @@ dfs.rename(columns= {
     'SDMVSTRA': 'VarianceStratum'
 }, inplace= True)
 
-# **Decoding column values **
-# I performed these mappings after checking the NHANES documentation, where I found that many of the columns used numeric codes to represent categorical values. For example, ParticipationStatus used 1 and 2 to indicate whether a person was only interviewed or both interviewed and examined, and Gender used 1.0 and 2.0 for male and female. To make the dataset more readable and easier to interpret, I converted these coded values into clear labels like "Male", "Female", "English", "Yes", "No", and so on.
+# The variance PSU and stratum columns are small whole numbers, so I downcast them to int16 to save memory. The survey weights stay as float64, because they carry around ten significant digits and the weighted population totals shown in the visualisations would be rounded in float32.
 
-dfs['ParticipationStatus']= dfs['ParticipationStatus'].map({1: 'Interviewed only', 2: 'Interviewed and Examined'})
-dfs['Gender']= dfs['Gender'].map({1.0: 'Male', 2.0: 'Female'})
-dfs['AgeGroup']= dfs['AgeGroup'].apply(lambda x: '80 or above' if x== 80 else 'Below 80' )
-dfs['Race']= dfs['Race'].map({1.0: 'Mexican American', 2.0: 'Other Hispanic', 3.0: 'Non- Hispanic Black', 4.0: 'Non- Hispanic White', 6.0: 'Non- Hispanic Asian', 7.0: 'Other Race'})
-dfs['CountryofBirth']= dfs['CountryofBirth'].map({1.0: 'US', 2.0: 'Others', 77.0: 'Refused', 99.0: 'Unknown'})
-dfs['LanguageofInterview']= dfs['LanguageofInterview'].map({1.0: 'English', 2.0: 'Spanish'})
-dfs['ProxyUsed']=dfs['ProxyUsed'].map({1.0: 'Yes', 2.0: 'No'})
-dfs['InterpreterUsed']= dfs['InterpreterUsed'].map({1.0: 'Yes', 2.0: 'No'})
+dfs= dfs.astype({'VariancePSU': 'int16', 'VarianceStratum': 'int16'})
+
+# **Decoding column values **
+# I performed these mappings after checking the NHANES documentation, where I found that many of the columns used numeric codes to represent categorical values. For example, ParticipationStatus used 1 and 2 to indicate whether a person was only interviewed or both interviewed and examined, and Gender used 1.0 and 2.0 for male and female. To make the dataset more readable and easier to interpret, I converted these coded values into clear labels like "Male", "Female", "English", "Yes", "No", and so on. Ages are top-coded at 80 in NHANES, so AgeGroup is derived with a single np.where() over the whole column and stored as a categorical with the two groups in age order. The other code-to-label mappings are collected in a single recode dictionary and applied with one replace() call, after which every decoded column is converted to a categorical whose categories are the labels in the order listed. This way the value counts, crosstabs and group-bys below work on small integer codes rather than on repeated strings, and any code missing from the dictionary still ends up as a missing value.
+
+recode= {
+    'ParticipationStatus': {1: 'Interviewed only', 2: 'Interviewed and Examined'},
+    'Gender': {1.0: 'Male', 2.0: 'Female'},
+    'Race': {1.0: 'Mexican American', 2.0: 'Other Hispanic', 3.0: 'Non- Hispanic Black', 4.0: 'Non- Hispanic White', 6.0: 'Non- Hispanic Asian', 7.0: 'Other Race'},
+    'CountryofBirth': {1.0: 'US', 2.0: 'Others', 77.0: 'Refused', 99.0: 'Unknown'},
+    'LanguageofInterview': {1.0: 'English', 2.0: 'Spanish'},
+    'ProxyUsed': {1.0: 'Yes', 2.0: 'No'},
+    'InterpreterUsed': {1.0: 'Yes', 2.0: 'No'}
+}
+dfs= dfs.replace(recode).astype({col: pd.CategoricalDtype(list(labels.values())) for col, labels in recode.items()})
+ages= dfs['AgeGroup'].to_numpy()
+dfs['AgeGroup']= pd.Categorical(np.where(ages== 80, '80 or above', 'Below 80'), categories= ['Below 80', '80 or above'])
 
 
 # # Exploring Categorical Variable Distributions 
-# I used the value_counts() function to quickly examine the distribution of values in each of the key categorical columns. This helped me understand how the data is spread across different categories such as participation status, gender, age group, race, country of birth, language of interview, and whether a proxy or interpreter was used. 
-
-print(dfs['ParticipationStatus'].value_counts())
-print("---------------------------------------")
-print(dfs['Gender'].value_counts())
-print("---------------------------------------")
-print(dfs['AgeGroup'].value_counts())
-print("---------------------------------------")
-print(dfs['Race'].value_counts())
-print("---------------------------------------")
-print(dfs['CountryofBirth'].value_counts())
-print("---------------------------------------")
-print(dfs['LanguageofInterview'].value_counts())
-print("---------------------------------------")
-print(dfs['ProxyUsed'].value_counts())
-print("---------------------------------------")
-print(dfs['InterpreterUsed'].value_counts())
+# I counted the participants in every category of the key categorical columns to quickly examine the distribution of their values. Rather than calling value_counts() once per column, the columns are melted into a single long table and counted with one group-by, which prints all the distributions together. This helped me understand how the data is spread across different categories such as participation status, gender, age group, race, country of birth, language of interview, and whether a proxy or interpreter was used. 
+
+cat_cols= ['ParticipationStatus', 'Gender', 'AgeGroup', 'Race', 'CountryofBirth', 'LanguageofInterview', 'ProxyUsed', 'InterpreterUsed']
+counts= dfs[cat_cols].melt().groupby(['variable', 'value'], sort= False).size()
+print(counts.to_string())
 
 # # Examining relationships between different attributes
 
-# I used a crosstab to examine the relationship between AgeGroup and ProxyUsed. This allowed me to see how proxy usage varies between participants who are below 80 years old and those who are 80 or above. The crosstab displays the count of participants in each age group who either did or did not use a proxy, helping me identify any patterns or significant differences in accessibility needs based on age. I used the same approach for three additional comparisons: Race vs LanguageofInterview, CountryofBirth vs InterpreterUsed, and ParticipationStatus vs Gender.
+# I used a crosstab to examine the relationship between AgeGroup and ProxyUsed. This allowed me to see how proxy usage varies between participants who are below 80 years old and those who are 80 or above. The crosstab displays the count of participants in each age group who either did or did not use a proxy, helping me identify any patterns or significant differences in accessibility needs based on age. I used the same approach for three additional comparisons: Race vs LanguageofInterview, CountryofBirth vs InterpreterUsed, and ParticipationStatus vs Gender. Since all of these columns are categoricals, the small xt() helper builds each crosstab by counting the observed category pairs with a group-by and unstacking the result, which gives the same table as pd.crosstab() without its extra overhead.
 
-pd.crosstab(dfs['AgeGroup'], dfs['ProxyUsed'])
+def xt(a, b):
+    return dfs.groupby([a, b], observed= True).size().unstack(fill_value= 0)
+
+
+xt('AgeGroup', 'ProxyUsed')
 
 
 # Surprisingly, proxy usage was more common among participants below 80 years of age, with nearly 36% requiring assistance during their interviews. In contrast, participants aged 80 or above had a much lower rate of proxy use, accounting for only 59 out of 682 individuals. This contradicts common assumptions that older adults are more likely to need assistance, and may reflect differences in survey engagement or living situations across age groups.
 
-pd.crosstab(dfs['Race'], dfs['LanguageofInterview'])
+xt('Race', 'LanguageofInterview')
 
 # Language needs varied significantly across racial groups. Spanish was frequently used among Mexican American and Other Hispanic participants, with these two groups having hundreds of interviews conducted in Spanish. Meanwhile, Non-Hispanic White, Black, Asian, and Other Race participants almost exclusively conducted their interviews in English, indicating that Spanish-language resources are particularly critical for Hispanic subpopulations.
 
-pd.crosstab(dfs['Gender'], dfs['ParticipationStatus'])
+xt('Gender', 'ParticipationStatus')
 
 # Participation in both the interview and examination components of the survey was high across genders, with only a small portion of individuals completing the interview alone. Interestingly, female participants were slightly more likely to complete the full examination process compared to males, with 92% of females and 91% of males participating fully.
 
-pd.crosstab(dfs['CountryofBirth'], dfs['InterpreterUsed'])
+xt('CountryofBirth', 'InterpreterUsed')
 
 # Interpreter assistance was used far more often by participants born outside the United States, with 348 non-U.S. born individuals needing interpreters compared to only 52 among U.S.-born respondents. This highlights the significant impact of language barriers among the immigrant population and underscores the importance of providing interpretation services to ensure accessibility and accurate data collection in public health research.
 
@@ -169,25 +198,27 @@ from bokeh.palettes import Category20
 
 # Group and prepare data
 grouped = (
-    dfs.groupby(['Race', 'ParticipationStatus'])['ExamWeight']
+    dfs.groupby(['Race', 'ParticipationStatus'], observed=True)['ExamWeight']
     .sum()
     .reset_index()
 )
 
 # Calculate percentages within each race group
-grouped['TotalByRace'] = grouped.groupby('Race')['ExamWeight'].transform('sum')
+race_totals = grouped.groupby('Race', observed=True)['ExamWeight'].sum()
+grouped['TotalByRace'] = grouped['Race'].map(race_totals).astype('float64')
 grouped['Percentage'] = (grouped['ExamWeight'] / grouped['TotalByRace']) * 100
 
 # Handle very small values for display
-grouped['DisplayWeight'] = grouped['ExamWeight'].apply(lambda x: x if x > 100000 else 100000)
+grouped['DisplayWeight'] = np.maximum(grouped['ExamWeight'].to_numpy(), 1e5)
 
 # Prepare x-axis as factor pairs
 grouped['x'] = list(zip(grouped['Race'], grouped['ParticipationStatus']))
 
 # Label for bar tops
-grouped['LabelText'] = grouped.apply(
-    lambda row: f"{int(row['ExamWeight']):,} ({row['Percentage']:.1f}%)", axis=1
-)
+grouped['LabelText'] = [
+    f"{int(weight):,} ({pct:.1f}%)"
+    for weight, pct in zip(grouped['ExamWeight'].to_numpy(), grouped['Percentage'].to_numpy())
+]
 
 # Create ColumnDataSource
 source = ColumnDataSource(grouped)
@@ -202,7 +233,7 @@ p = figure(
     tools=""
 )
 
-# Draw bars
+# Draw bars (examined participants get the stronger colour)
 p.vbar(
     x='x',
     top='DisplayWeight',
@@ -210,7 +241,7 @@ p.vbar(
     source=source,
     fill_color=factor_cmap('x',
         palette=Category20[20],
-        factors=list(dfs['ParticipationStatus'].unique()),
+        factors=['Interviewed and Examined', 'Interviewed only'],
         start=1, end=2)
 )
 
@@ -276,7 +307,7 @@ output_notebook()
 
 # Group data and sum InterviewWeight
 lang_group = (
-    dfs.groupby(['Race', 'LanguageofInterview'])['InterviewWeight']
+    dfs.groupby(['Race', 'LanguageofInterview'], observed=True)['InterviewWeight']
     .sum()
     .unstack(fill_value=0)
     .reset_index()
@@ -345,27 +376,20 @@ from bokeh.palettes import OrRd
 
 output_notebook()
 
-# Prepare simplified data
-data = []
-
-# Loop through both support types
-for col in ['ProxyUsed', 'InterpreterUsed']:
-    grouped = dfs.groupby(['AgeGroup', col])['InterviewWeight'].sum().unstack(fill_value=0)
-    
-    # Calculate percentage of 'Yes' for each AgeGroup
-    if 'Yes' in grouped.columns:
-        total = grouped.sum(axis=1)
-        percentage_yes = (grouped['Yes'] / total) * 100
-
-        for age_group, value in percentage_yes.items():
-            data.append({
-                'AgeGroup': age_group,
-                'SupportType': 'Proxy' if col == 'ProxyUsed' else 'Interpreter',
-                'Percentage': value
-            })
-
-# Convert to DataFrame and source
-df_heat = pd.DataFrame(data)
+# Stack both support types into one column so a single pivot covers them
+support = dfs.melt(id_vars=['AgeGroup', 'InterviewWeight'],
+                   value_vars=['ProxyUsed', 'InterpreterUsed'],
+                   var_name='SupportType', value_name='Used')
+pivot = support.pivot_table(index=['AgeGroup', 'SupportType'], columns='Used',
+                            values='InterviewWeight', aggfunc='sum',
+                            fill_value=0, observed=True)
+pivot = pivot.reindex(columns=['Yes', 'No'], fill_value=0)
+
+# Calculate percentage of 'Yes' for each AgeGroup and support type
+df_heat = (pivot['Yes'] / pivot.sum(axis=1) * 100).rename('Percentage').reset_index()
+df_heat['SupportType'] = df_heat['SupportType'].replace({'ProxyUsed': 'Proxy', 'InterpreterUsed': 'Interpreter'})
+
+# Convert to source
 source = ColumnDataSource(df_heat)
 
 # Color mapping
@@ -424,7 +448,7 @@ output_notebook()
 
 # Group data by CountryOfBirth and InterpreterUsed
 grouped = (
-    dfs.groupby(['CountryofBirth', 'InterpreterUsed'])['InterviewWeight']
+    dfs.groupby(['CountryofBirth', 'InterpreterUsed'], observed=True)['InterviewWeight']
     .sum()
     .reset_index()
 )
@@ -433,7 +457,7 @@ grouped = (
 source = ColumnDataSource(grouped)
 
 # Create scatter plot
-p = figure(x_range=grouped['CountryofBirth'].unique().tolist(),
+p = figure(x_range=grouped['CountryofBirth'].cat.remove_unused_categories().cat.categories.tolist(),
            height=450,
            width=700,
            title="Interpreter Use by Country of Birth (Weighted Count)",
@@ -488,23 +512,46 @@ show(p)
 
 # +
 import plotly.express as px
+import plotly.graph_objects as go
 
 # Create a combined group label
-dfs['Group'] = dfs['Gender'] + ' - ' + dfs['AgeGroup']
+dfs['Group'] = dfs['Gender'].astype('string') + ' - ' + dfs['AgeGroup'].astype('string')
 
 # Filter rows with InterviewWeight present
 filtered_df = dfs.dropna(subset=['Group', 'InterviewWeight'])
 
-# Create refined box plot
-fig = px.box(
-    filtered_df,
-    x='Group',
-    y='InterviewWeight',
+# Five-number summary for each group, with quartiles computed the way Plotly does
+summary = (
+    filtered_df.groupby('Group', sort=False)['InterviewWeight']
+    .agg(
+        q1=lambda w: np.quantile(w, 0.25, method='hazen'),
+        median=lambda w: np.quantile(w, 0.5, method='hazen'),
+        q3=lambda w: np.quantile(w, 0.75, method='hazen'),
+        lowerfence='min',
+        upperfence='max'
+    )
+    .reset_index()
+)
+
+# Create refined box plot from the precomputed statistics
+colors = px.colors.qualitative.Set3
+fig = go.Figure([
+    go.Box(
+        x=[row.Group],
+        name=row.Group,
+        q1=[row.q1],
+        median=[row.median],
+        q3=[row.q3],
+        lowerfence=[row.lowerfence],
+        upperfence=[row.upperfence],
+        marker_color=colors[i % len(colors)]
+    )
+    for i, row in enumerate(summary.itertuples())
+])
+fig.update_layout(
     title='Distribution of Interview Weights by Gender and Age Group',
-    labels={'InterviewWeight': 'Interview Weight'},
-    color='Group',
-    color_discrete_sequence=px.colors.qualitative.Set3,
-    points=False, # Hide individual points for cleaner visual
+    xaxis_title='Group',
+    yaxis_title='Interview Weight',
     height= 600
 )
 
@@ -515,7 +562,7 @@ fig.show()
 # -
 
 # **Description:**
-# This box plot visualizes the variation in InterviewWeight across different combinations of gender and age group. The x-axis groups participants into categories such as “Male - Below 80” and “Female - 80 or above,” while the y-axis represents their assigned interview weight — a metric that estimates how many individuals each respondent represents in the overall U.S. population. The plot displays the median, interquartile range (IQR), and any statistical outliers for each demographic group. Colors differentiate each category, and the layout is optimized for readability by hiding individual data points and increasing figure height.
+# This box plot visualizes the variation in InterviewWeight across different combinations of gender and age group. The x-axis groups participants into categories such as “Male - Below 80” and “Female - 80 or above,” while the y-axis represents their assigned interview weight — a metric that estimates how many individuals each respondent represents in the overall U.S. population. The plot displays the median and interquartile range (IQR) for each demographic group, with whiskers extending to the smallest and largest weight in the group. Colors differentiate each category, and the layout is optimized for readability by hiding individual data points and increasing figure height. The quartiles and whisker limits are computed in pandas beforehand, so only these five numbers per group are sent to the plot instead of every participant's weight.
 #
 # **Conclusion:**
 # The distribution of interview weights reveals some variation between demographic groups. Generally, the IQR and median values are relatively consistent across categories, suggesting balanced population representation in the NHANES sample design. However, slight differences in spread or outliers may reflect specific subpopulations that were either oversampled or underrepresented in certain age or gender segments. This visualization reinforces the importance of understanding the weight variable not as a direct count, but as a reflection of national-level representation — key for drawing generalizable health conclusions from the survey data.